@@ -0,0 +1,45 @@
+import numpy as np
+from numba import njit
+
+from core.game_symbol import _EMPTY, _FULL, _O, _X
+from core.tables import build_rays
+
+# Integer codes of the symbols stored in Board._grid, as plain ints for the compiled kernels
+EMPTY = int(_EMPTY)
+X = int(_X)
+O = int(_O)
+FULL = int(_FULL)
+
+@njit(cache=True)
+def check_winner(grid, rays, x0, y0):
+    """
+    Checks for a winning sequence of equal player codes (X or O) on the rays through
+    (x0, y0) of an int8 grid. The streak length is implied by the ray table.
+
+    Returns:
+        int: The code of the winning symbol, or EMPTY if there is none.
+    """
+    cells = grid.reshape(grid.size)
+    streak = rays.shape[3] // 2
+    for d in range(rays.shape[2]):
+        count = 0
+        prev = EMPTY
+        for index in rays[x0, y0, d]:
+            if index < 0:
+                break
+            code = cells[index]
+            if code == X or code == O:
+                if code == prev:
+                    count += 1
+                else:
+                    count = 1
+            else:
+                count = 0
+            prev = code
+            if count == streak:
+                return prev
+    return EMPTY
+
+
+# Compile the kernel at import time instead of on the first move played
+check_winner(np.zeros((3, 3), dtype=np.int8), build_rays(3, 3, 3), 0, 0)
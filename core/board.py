@@ -1,7 +1,19 @@
+from functools import lru_cache, partial
+from typing import Callable
+
+import numpy as np
+
+from core import _kernels, gpu_kernels, tables
 from core.placeable import Placeable
-from core.game_symbol import GameSymbol
+from core.game_symbol import _EMPTY, _FULL, _O, _X, GameSymbol
 from core.move import Move
 from core.cell import Cell
+from core.leaf_board import LeafBoard
+
+# GameSymbol members indexed by their grid code
+_SYMBOLS = tuple(GameSymbol)
+# Maximal number of memoized winners per board shape
+_WINNER_CACHE_SIZE = 1 << 16
 
 
 class Board(Placeable):
@@ -15,38 +27,175 @@ class Board(Placeable):
         gameMoves (list[Move]): History of moves played on this board.
         symbol (GameSymbol): Current symbol representing the board's state (empty, full, or winner).
         winStreak (int): Number of consecutive symbols required to win on this board.
+        x_bb (int): Bitboard of cells won by X, bit index is row * cols + col.
+        o_bb (int): Bitboard of cells won by O, bit index is row * cols + col.
 
     """
 
+    # Winning line masks of the classic 3x3 board with a streak of 3
+    LINES = (
+        0b111,
+        0b111 << 3,
+        0b111 << 6,
+        0o111,
+        0o222,
+        0o444,
+        0b100010001,
+        0b001010100,
+    )
+
+    __slots__ = (
+        "cells",
+        "dimensions",
+        "rows",
+        "cols",
+        "game_moves",
+        "symbol",
+        "win_streak",
+        "x_bb",
+        "o_bb",
+        "_flat",
+        "_winner",
+        "_empty_positions",
+        "_cell_children",
+        "_grid",
+        "_lines",
+        "_rays",
+        "_zobrist",
+        "_zobrist_keys",
+        "_winner_cache",
+    )
+
     cells: list[list[Placeable]]
 
     def __init__(
         self,
         dimensions: tuple,
         cell_type: Placeable.__class__,
-        cell_params: dict = {},
+        cell_params: dict | None = None,
         win_streak: int = 3,
     ):
+        if cell_params is None:
+            cell_params = {}
         if cell_type not in Placeable.__subclasses__():
             raise TypeError(
                 f"cell_type must be a subclass of Placeable, got {cell_type}"
             )
+        self._init_state(
+            [cell_type(**cell_params) for _ in range(dimensions[0] * dimensions[1])],
+            dimensions,
+            win_streak,
+            cell_type is Cell,
+        )
+
+    def _init_state(self, flat: list, dimensions: tuple, win_streak: int, cell_children: bool) -> None:
+        """
+        Assigns the state of an empty board made of the given cells, listed in row-major order.
+        Shared by `__init__` and the constructors returned by `_build_specialized`.
+        """
+        (positions, row_bounds, lines, rays, zobrist_keys, winner_cache) = self._shape_tables(
+            dimensions[0], dimensions[1], win_streak
+        )
+        for cell, position in zip(flat, positions):
+            cell.position = position
+        self.position = None
         self.dimensions = dimensions
         self.rows = dimensions[0]
         self.cols = dimensions[1]
-        self.cells = [
-            [cell_type(**cell_params) for _ in range(dimensions[1])]
-            for _ in range(dimensions[0])
-        ]
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.cells[i][j].position = (i, j)
+        self.cells = [flat[start:end] for (start, end) in row_bounds]
+        # Row-major flat view of the cells, the cell at (i, j) is self._flat[i * self.cols + j]
+        self._flat = flat
         self.game_moves: list[Move] = []
-        self.symbol = GameSymbol.empty
+        self.symbol = _EMPTY
         self.win_streak = win_streak
+        self.x_bb = 0
+        self.o_bb = 0
+        self._winner = _EMPTY
+        # Positions of the empty cells, a dict is used as an insertion-ordered set
+        self._empty_positions = dict.fromkeys(positions)
+        self._cell_children = cell_children
+        self._grid = np.zeros(dimensions, dtype=np.int8)
+        self._lines = lines
+        self._rays = rays
+        self._zobrist = 0
+        self._zobrist_keys = zobrist_keys
+        self._winner_cache = winner_cache
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _shape_tables(rows: int, cols: int, streak: int) -> tuple:
+        """
+        Returns the shape-dependent state shared by all boards of the given shape: cell positions
+        in row-major order, bounds of each row in that order, line masks, ray, Zobrist and winner
+        tables. Results are cached per shape.
+        """
+        return (
+            tuple(divmod(index, cols) for index in range(rows * cols)),
+            tuple((i * cols, (i + 1) * cols) for i in range(rows)),
+            Board._line_masks(rows, cols, streak),
+            Board._ray_table(rows, cols, streak),
+            Board._zobrist_table(rows, cols),
+            Board._winner_table(rows, cols, streak),
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _line_masks(rows: int, cols: int, streak: int) -> tuple[int, ...]:
+        """
+        Returns bit masks of all horizontal, vertical and diagonal runs of length `streak`
+        on a board of the given shape. Results are cached per shape.
+        """
+        if (rows, cols, streak) == (3, 3, 3):
+            return Board.LINES
+        return tables.line_masks(rows, cols, streak)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _ray_table(rows: int, cols: int, streak: int) -> np.ndarray:
+        """
+        Returns the rays through every position of a board of the given shape as flat cell
+        indices (see `tables.build_rays`). The table is shared by all boards of that shape
+        and must not be modified.
+        """
+        return tables.build_rays(rows, cols, streak)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _zobrist_table(rows: int, cols: int) -> list[list[list[int]]]:
+        """
+        Returns the Zobrist keys of a board of the given shape, indexed as [row][col][symbol].
+        Keys of GameSymbol.empty are 0, so an empty board hashes to 0.
+        """
+        rng = np.random.default_rng(0x5EED)
+        keys = rng.integers(1, 1 << 63, size=(rows, cols, len(GameSymbol)), dtype=np.uint64)
+        keys[:, :, _EMPTY] = 0
+        return keys.tolist()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _winner_table(rows: int, cols: int, streak: int) -> dict[int, GameSymbol]:
+        """
+        Returns the transposition table memoizing winners by Zobrist hash, shared by all
+        boards of the given shape and streak.
+        """
+        return {}
+
+    def _sync_cell(self, x: int, y: int) -> None:
+        """
+        Updates the bitboards, the symbol grid and the Zobrist hash from the current
+        symbol of the cell at (x, y)
+        """
+        index = x * self.cols + y
+        bit = 1 << index
+        symbol = self._flat[index].symbol
+        keys = self._zobrist_keys[x][y]
+        self._zobrist ^= keys[self._grid.item(x, y)] ^ keys[symbol]
+        self._grid[x, y] = symbol
+        self.x_bb = self.x_bb | bit if symbol is _X else self.x_bb & ~bit
+        self.o_bb = self.o_bb | bit if symbol is _O else self.o_bb & ~bit
 
     @classmethod
-    def layers_init(cls, layers, cell_type=Cell, cell_params={}) -> "Board":
+    def layers_init(cls, layers, cell_type=Cell, cell_params=None) -> "Board":
         """
         Initializes a multi-layered board structure based on the provided layer configurations.
         Args:
@@ -57,11 +206,28 @@ class Board(Placeable):
         Returns:
             An instance of the class (cls) representing the initialized multi-layered board.
         Notes:
-            - The first layer is initialized with basic cell types.
+            - The first layer is initialized with basic cell types. With the default Cell type and more
+              than one layer, the first layer is built from LeafBoard instances instead.
             - Subsequent layers are initialized recursively, nesting the previous layer as their cell type.
-            - Assumes the existence of a 'Cell' class in the current scope.
+            - A Board with the default Cell type is built by a constructor specialized for the
+              layer shapes (see `_build_specialized`).
+        Raises:
+            TypeError: If cell_params are given with the default Cell type, which takes no parameters.
         """
 
+        if cell_type is Cell:
+            if cell_params:
+                raise TypeError(f"Cell takes no parameters, got {cell_params}")
+            if cls is Board:
+                shapes = tuple(
+                    (layer["dimensions"][0], layer["dimensions"][1], layer["streak"])
+                    for layer in layers
+                )
+                return cls._build_specialized(shapes)()
+
+        if cell_params is None:
+            cell_params = {}
+
         def _params(dims, ct, cp, st):
             return {
                 "dimensions": dims,
@@ -70,12 +236,56 @@ class Board(Placeable):
                 "win_streak": st,
             }
 
+        if len(layers) > 1 and cell_type is Cell:
+            # The first layer holds its cells in bitboards instead of Cell objects
+            cell_type = LeafBoard
+            cell_params = {
+                "dimensions": layers[0]["dimensions"],
+                "win_streak": layers[0]["streak"],
+            }
+            layers = layers[1:]
+
         result = _params(layers[0]["dimensions"], cell_type, cell_params, layers[0]["streak"])
         if len(layers) > 1:
             for layer in layers[1:]:
                 result = _params(layer["dimensions"], cls, result, layer["streak"])
         return cls(**result)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_specialized(shapes: tuple) -> Callable[[], "Board"]:
+        """
+        Returns a constructor of the multi-layered Board with the given layer shapes.
+
+        The child constructor is resolved once per shapes and bound in the returned closure,
+        which then fills the board through `_init_state` instead of going through `__init__`
+        and its argument checks. Subclasses of Board are built through `__init__`.
+
+        Args:
+            shapes (tuple of tuple[int, int, int]): (rows, cols, streak) of each layer, lowest layer first.
+                The lowest layer is made of Cell objects if it is the only layer, otherwise of LeafBoards.
+        Returns:
+            Callable[[], Board]: A function returning a new, empty board.
+        """
+        (rows, cols, streak) = shapes[-1]
+        if len(shapes) == 1:
+            make_cell = Cell
+        elif len(shapes) == 2:
+            make_cell = partial(LeafBoard, shapes[0][:2], shapes[0][2])
+        else:
+            make_cell = Board._build_specialized(shapes[:-1])
+
+        dimensions = (rows, cols)
+        size = rows * cols
+        cell_children = make_cell is Cell
+
+        def build() -> "Board":
+            board = object.__new__(Board)
+            board._init_state([make_cell() for _ in range(size)], dimensions, streak, cell_children)
+            return board
+
+        return build
+
     def __str__(self):
         return str(self.dimensions) + str(self.cells)
 
@@ -85,38 +295,27 @@ class Board(Placeable):
     def __eq__(self, value):
         return self.cells == value.cells
 
-    def _check_active_availability(self, active) -> list[bool]:
+    def _first_unavailable(self, active) -> int | None:
         """
-        Recursively checks whether the specified 'active' path is available for play.
+        Walks the specified 'active' path and finds the first position that is not available for play.
 
         Args:
             active (list): A list of coordinate pairs representing the path to check within the board's cells.
 
         Returns:
-            list of bool: A list indicating, for each step in the path, whether the corresponding cell is available.
-                - True if the cell is available for play.
-                - False otherwise.
+            int | None: The index in `active` of the first sub-board that is already decided
+                (its symbol is not empty), or None if the whole path is available.
+                `active[:index]` is the playable part of the path.
 
         Notes:
-            - The method traverses the board recursively following the 'active' path.
-            - Availability is determined based on the cell's symbol and position.
-            - If the path is empty, returns whether the current cell is empty.
-        """
-        if len(active) == 0:
-            return [self.symbol == GameSymbol.empty]
-        if self.symbol == GameSymbol.empty:
-            result = []
-            if self.position:
-                result.append(True)
-            if active != []:
-                result.extend(
-                    self.cells[active[0][0]][active[0][1]]._checkActiveAvailability(
-                        active[1:]
-                    )
-                )
-            return result
-        else:
-            return [False]
+            - The walk stops as soon as an unavailable sub-board is found.
+        """
+        node = self
+        for depth, (x, y) in enumerate(active):
+            node = node.cells[x][y]
+            if node.symbol is not _EMPTY:
+                return depth
+        return None
 
     def make_move(self, move: Move) -> bool:
         """
@@ -132,17 +331,18 @@ class Board(Placeable):
             - Updates the winner symbol if the move results in a win.
             - Appends the move to the gameMoves history.
         """
-        if self._is_in_board(move.position[0], move.position[1]):
-            if (
-                self.cells[move.position[0]][move.position[1]].symbol
-                == GameSymbol.empty
-            ):
-                if self.cells[move.position[0]][move.position[1]].makeMove(
-                    move.sub_move()
-                ):
-                    self.symbol = self.winner
-                    self.game_moves.append(move)
-                    return True
+        (x, y) = move.position
+        if self._is_in_board(x, y):
+            cell = self.cells[x][y]
+            if cell.symbol is _EMPTY and cell.make_move(move.sub_move()):
+                self._sync_cell(x, y)
+                if cell.symbol is not _EMPTY:
+                    del self._empty_positions[(x, y)]
+                    if self._winner is _EMPTY:
+                        self._winner = self._cached_winner((x, y))
+                self.symbol = self.winner
+                self.game_moves.append(move)
+                return True
 
         raise Exception(f"Invalid move {move} played")
 
@@ -161,7 +361,19 @@ class Board(Placeable):
             - Only the most recent move can be undone.
         """
         if self.game_moves[-1] == move:
-            self.cells[move.position[0]][move.position[1]].undo_move(move.sub_move())
+            (x, y) = move.position
+            cell = self.cells[x][y]
+            previous_symbol = cell.symbol
+            cell.undo_move(move.sub_move())
+            self._sync_cell(x, y)
+            if previous_symbol is not _EMPTY and cell.symbol is _EMPTY:
+                self._empty_positions[(x, y)] = None
+            # Keep the first winner while it still owns a line, a rescan could pick the opponent
+            winner = self._winner
+            if winner is not _EMPTY and not self._owns_line(
+                self.x_bb if winner is _X else self.o_bb
+            ):
+                self._winner = self._cached_winner()
             self.symbol = self.winner
             self.game_moves.pop()
         else:
@@ -178,36 +390,70 @@ class Board(Placeable):
             None: If the game is still ongoing (no winner and empty cells remain).
         """
         temp = self.winner
-        if temp != GameSymbol.empty:
+        if temp is not _EMPTY:
             return temp
         temp = self.empty_cells
         if temp == 0:
-            return GameSymbol.full
+            return _FULL
         return None
 
     @property
     def empty_cells(self) -> int:
         """Return number of empty cells in the board"""
-        result = 0
-        for row in self.cells:
-            for cell in row:
-                if cell.symbol == GameSymbol.empty:
-                    result += 1
-        return result
+        return len(self._empty_positions)
 
     @property
     def winner(self) -> GameSymbol:
         """Return winner of the board. If it returns GameSymbol.empty, no winner found"""
-        result = GameSymbol.empty
-        for row in self.cells:
-            for cell in row:
-                result = self._check_winner_from_pos(cell.position)
-                if result != GameSymbol.empty:
-                    return result
-        if self.empty_cells == 0:
-            return GameSymbol.full
+        if self._winner is not _EMPTY:
+            return self._winner
+        if not self._empty_positions:
+            return _FULL
+        return _EMPTY
 
-        return result
+    def _cached_winner(self, position=None) -> GameSymbol:
+        """
+        Returns the winner of the current layout of the board's cells, memoized by its Zobrist hash.
+
+        Args:
+            position (tuple[int, int], optional): Position of the last decided cell. On a cache miss,
+                only the lines through it are checked, which is valid only if the board had no
+                winner before that cell was decided. If None, all lines are checked.
+
+        Returns:
+            GameSymbol: The winning symbol, or GameSymbol.empty if there is none.
+        """
+        winner = self._winner_cache.get(self._zobrist)
+        if winner is None:
+            if position is None:
+                winner = self._line_winner()
+            else:
+                winner = self._check_winner_from_pos(position)
+            if len(self._winner_cache) >= _WINNER_CACHE_SIZE:
+                self._winner_cache.clear()
+            self._winner_cache[self._zobrist] = winner
+        return winner
+
+    def _line_winner(self) -> GameSymbol:
+        """Scans all winning lines of the board and returns the symbol owning one of them, if any"""
+        # A player holding fewer cells than the streak cannot own a line, skip their bitboard
+        x_bb = self.x_bb if self.x_bb.bit_count() >= self.win_streak else 0
+        o_bb = self.o_bb if self.o_bb.bit_count() >= self.win_streak else 0
+        if not (x_bb or o_bb):
+            return _EMPTY
+        for mask in self._lines:
+            if x_bb & mask == mask:
+                return _X
+            if o_bb & mask == mask:
+                return _O
+        return _EMPTY
+
+    def _owns_line(self, bitboard: int) -> bool:
+        """Checks whether the bitboard holds all cells of one of the winning lines"""
+        for mask in self._lines:
+            if bitboard & mask == mask:
+                return True
+        return False
 
     def sub_board(self, positions) -> Placeable:
         """
@@ -223,7 +469,8 @@ class Board(Placeable):
         """
 
         if positions != []:
-            return self.cells[positions[0][0]][positions[0][1]].subBoard(positions[1:])
+            (x, y) = positions[0]
+            return self.cells[x][y].sub_board(positions[1:])
         else:
             return super().sub_board(position=None)
 
@@ -233,8 +480,9 @@ class Board(Placeable):
 
         Iterates in all four primary directions (horizontal, vertical, and both diagonals)
         from the specified position to determine if there is a contiguous sequence of the
-        same non-empty symbol of length `self.winStreak`. Optionally, a custom streak length
-        can be provided via the `streak` parameter.
+        same player symbol (X or O) of length `self.winStreak`. Optionally, a custom streak length
+        can be provided via the `streak` parameter. The scan runs on the symbol grid
+        in the compiled `_kernels.check_winner`, following the precomputed ray table.
 
         Args:
             position (tuple[int, int]): The (x, y) coordinates to start checking from.
@@ -246,69 +494,48 @@ class Board(Placeable):
             returns `GameSymbol.empty`.
         """
         (x0, y0) = position
-        ray_directions = [[1, 0], [0, 1], [1, 1], [1, -1]]
-        for ray_direction in ray_directions:
-            ray = self._dxdy_ray(x0, y0, *ray_direction, streak)
-            count = 0
-            prev_symbol = GameSymbol.empty
-            for cell in ray:
-                if cell.symbol != GameSymbol.empty and (
-                    cell.symbol == prev_symbol or prev_symbol == GameSymbol.empty
-                ):
-                    count += 1
-                else:
-                    count = 0
-                prev_symbol = cell.symbol
-                if count == self.win_streak:
-                    return prev_symbol
-        return GameSymbol.empty
+        if streak is None:
+            rays = self._rays
+        else:
+            rays = self._ray_table(self.rows, self.cols, streak)
+        return _SYMBOLS[_kernels.check_winner(self._grid, rays, x0, y0)]
 
     def _is_in_board(self, x, y):
         """Checks if given coordinates are within the board's dimensions"""
-        if not isinstance(x, int) or not isinstance(y, int):
-            return False
-        return x >= 0 and y >= 0 and x < self.rows and y < self.cols
+        return 0 <= x < self.rows and 0 <= y < self.cols
 
-    def _dxdy_ray(self, x0, y0, dx, dy, streak=None):
+    def get_empty_cells(self) -> Placeable:
         """
-        Returns a list of cell values forming a ray in a specified direction from a given starting point.
-        The ray extends both forwards and backwards from (x0, y0) along the (dx, dy) direction,
-        with a total length of 2 * streak (defaulting to self.winStreak if not specified).
-        Only cells within the board boundaries are included.
-        Args:
-            x0 (int): The starting x-coordinate.
-            y0 (int): The starting y-coordinate.
-            dx (int): The x-direction increment for the ray.
-            dy (int): The y-direction increment for the ray.
-            streak (int, optional): The number of steps to extend in each direction from the starting point.
-                If None, uses self.winStreak.
+        Returns a list of positions of all empty cells on the board.
+        The positions are maintained incrementally by `make_move` and `undo_move`;
+        cells emptied by an undo are listed last.
         Returns:
-            list: A list of cell values along the ray within the board boundaries.
+            Placeable: A list of positions (or objects) representing empty cells.
         """
-        result = []
-        if streak is None:
-            streak = self.win_streak
-
-        for i in range(-streak, streak):
-            if self._is_in_board(x0 + i * dx, y0 + i * dy):
-                result.append(self.cells[x0 + i * dx][y0 + i * dy])
+        return list(self._empty_positions)
 
-        return result
+    def dense_grid(self) -> np.ndarray:
+        """
+        Returns the symbols of the lowest layer cells as one int8 grid of GameSymbol values,
+        the grids of the sub-boards being placed next to each other (9x9 for ultimate tic-tac-toe).
+        """
+        if self._cell_children:
+            return self._grid.copy()
+        return np.block([[cell.dense_grid() for cell in row] for row in self.cells])
 
-    def get_empty_cells(self) -> Placeable:
+    @classmethod
+    def winner_batch(cls, states: np.ndarray) -> np.ndarray:
         """
-        Returns a list of positions of all empty cells on the board.
-        Iterates through the board's cells and collects the positions of cells
-        whose symbol is `GameSymbol.empty`.
+        Returns the winners of a batch of ultimate tic-tac-toe states, evaluated on the GPU
+        when a CUDA device is available (see `gpu_kernels.winners_batch`). Legal move masks
+        are not computed, use `gpu_kernels.evaluate_batch` for those.
+        Single states should keep using `winner`.
+        Args:
+            states (np.ndarray): (B, 9, 9) grids as returned by `dense_grid`.
         Returns:
-            Placeable: A list of positions (or objects) representing empty cells.
+            np.ndarray: (B,) int8 GameSymbol values of the winners.
         """
-        result = []
-        for row in self.cells:
-            for cell in row:
-                if cell.symbol == GameSymbol.empty:
-                    result.append(cell.position)
-        return result
+        return gpu_kernels.winners_batch(states)
 
     def get_valid_moves(
         self, active=None, first=True, desired_symbol=GameSymbol.empty
@@ -326,37 +553,48 @@ class Board(Placeable):
         Returns:
             list[Move]: A list of valid Move objects for the current board state.
         """
-        if self.winner != GameSymbol.empty:
+        if self.winner is not _EMPTY:
             return []
         if active is None:
             active = self.get_active()
-        moves: list[Move] = []
-        result = []
-        eCellPositions = self.get_empty_cells()
         if first:
-            try:
-                active = active[
-                    : self._check_active_availability(active=active).index(False)
-                ]
-            except Exception:
-                pass
-
-        if len(active) >= 1:
-            moves = self.cells[active[0][0]][active[0][1]].get_valid_moves(
-                active[1:], first=False
-            )
+            index = self._first_unavailable(active)
+            if index is not None:
+                active = active[:index]
+            prefix, symbol = [], desired_symbol
         else:
-            for pos in eCellPositions:
-                moves.extend(self.cells[pos[0]][pos[1]].get_valid_moves(first=False))
-        if first:
-            for move in moves:
-                if move.symbol == GameSymbol.empty:
-                    move.symbol = desired_symbol
-                    result.append(move)
-        else:
-            for move in moves:
-                result.append(move.super_move([self.position]))
-        return result
+            prefix, symbol = [self.position], _EMPTY
+
+        moves: list[Move] = []
+        self._collect_moves(active, prefix, moves, symbol)
+        return moves
+
+    def _collect_moves(self, active, prefix, out, symbol) -> None:
+        """
+        Appends the valid moves of this board to `out`, building each Move only once.
+
+        Args:
+            active (Optional[list[tuple[int, int]]]): Path of the active cell positions below this board.
+                If empty or None, every empty cell is playable.
+            prefix (list[tuple[int, int]]): Positions leading from the root board to this board.
+            out (list[Move]): List collecting the moves.
+            symbol (GameSymbol): Symbol assigned to the collected moves.
+        """
+        if self.symbol is not _EMPTY:
+            return
+        if active:
+            (x, y) = active[0]
+            self.cells[x][y]._collect_moves(active[1:], [*prefix, (x, y)], out, symbol)
+            return
+        if self._cell_children:
+            out.extend(
+                [Move([*prefix, position], symbol) for position in self._empty_positions]
+            )
+            return
+        cells = self.cells
+        for position in self._empty_positions:
+            (x, y) = position
+            cells[x][y]._collect_moves(None, [*prefix, position], out, symbol)
 
     def get_active(self):
         """
@@ -365,7 +603,7 @@ class Board(Placeable):
         This method analyzes the last move in the game history (`self.gameMoves`) and uses its positions
         to compute which positions are currently active for the next move. If there are no moves yet,
         it returns an empty list. If not all positions are available (as determined by
-        `_check_active_availability`), it returns the positions up to the first unavailable one.
+        `_first_unavailable`), it returns the positions up to the first unavailable one.
         Otherwise, it returns all positions from the last move except the first.
 
         Returns:
@@ -373,7 +611,8 @@ class Board(Placeable):
         """
         if len(self.game_moves) == 0:
             return []
-        avail = self._check_active_availability(active=self.game_moves[-1].positions[1:])
-        if not all(avail):
-            return self.game_moves[-1].positions[1 : avail.index(False)]
-        return self.game_moves[-1].positions[1:]
+        active = self.game_moves[-1].positions[1:]
+        index = self._first_unavailable(active)
+        if index is not None:
+            return active[:index]
+        return active
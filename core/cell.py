@@ -1,9 +1,7 @@
-from core.game_symbol import GameSymbol
+from core.game_symbol import _EMPTY
 from core.move import Move
 from core.placeable import Placeable
 
-from typing import List
-
 
 class Cell(Placeable):
     """
@@ -19,13 +17,15 @@ class Cell(Placeable):
         make_move(move): Places a symbol in the cell according to the move.
         undo_move(move): Removes the symbol if it matches the move's symbol.
         winner: Property returning the symbol as the winner (or empty if none).
-        _check_active_availability(active): Checks if the cell is available for a move.
         get_valid_moves(active, first): Returns a list of valid moves for this cell.
     """
 
+    __slots__ = ("dimensions", "symbol")
+
     def __init__(self) -> None:
+        self.position = None
         self.dimensions = (1, 1)
-        self.symbol = GameSymbol.empty
+        self.symbol = _EMPTY
 
     def __str__(self) -> str:
         return str(self.symbol)
@@ -37,7 +37,7 @@ class Cell(Placeable):
         """
         Place a symbol in the cell according to the move.
         """
-        if self.symbol != GameSymbol.empty:
+        if self.symbol is not _EMPTY:
             return False
         self.symbol = move.symbol
         return True
@@ -46,8 +46,8 @@ class Cell(Placeable):
         """
         Remove the symbol from the cell if it matches the move's symbol.
         """
-        if self.symbol == move.symbol:
-            self.symbol = GameSymbol.empty
+        if self.symbol is move.symbol:
+            self.symbol = _EMPTY
             return True
         return False
 
@@ -56,28 +56,26 @@ class Cell(Placeable):
         """Return winner of the board. If GameSymbol.empty returned, no winner was found"""
         return self.symbol
 
-    def _check_active_availability(self, active=None) -> List[bool]:
-        """
-        Checks if the cell is available for activation.
-        Args:
-            active (optional): An optional parameter that may be used to specify the active state. On Cell level, it is not used.
-        Returns:
-            List[bool]: [True] if the cell's symbol is empty (i.e., the cell is available), [False] otherwise.
-        """
-        return [self.symbol == GameSymbol.empty]
-
-    def get_valid_moves(self, active=[], first=True):
+    def get_valid_moves(self, active=None, first=True):
         """
         Returns a list of valid moves for the current cell.
         If the cell is empty, returns a list containing a single Move object representing
         the possible move at this cell's position. Otherwise, returns an empty list.
 
         Args (all unused on Cell level):
-            active (list, optional): A list of currently active cells or positions. Defaults to [].
+            active (list, optional): A list of currently active cells or positions. Defaults to None.
             first (bool, optional): Indicates if this is the first move in a sequence. Defaults to True.
         Returns:
             list[Move]: A list of valid Move objects for this cell, which is only one Move containing the cell's position and empty symbol.
         """
 
-        if self.symbol == GameSymbol.empty:
+        if self.symbol is _EMPTY:
             return [Move([self.position], self.symbol)]
+
+    def _collect_moves(self, active, prefix, out, symbol) -> None:
+        """
+        Appends the move into this cell to `out` if the cell is empty.
+        `prefix` already ends with this cell's position, `active` is unused on Cell level.
+        """
+        if self.symbol is _EMPTY:
+            out.append(Move(prefix, symbol))
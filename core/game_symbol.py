@@ -1,5 +1,25 @@
-class GameSymbol:
-    empty = " "
-    X = "X"
-    O = "O"
-    full = "#"
+from enum import IntEnum, unique
+
+
+@unique
+class GameSymbol(IntEnum):
+    """
+    Symbols a cell or a board can hold. Members are singletons, compare them with `is`.
+    The integer values are the codes stored in the boards' symbol grids.
+    """
+
+    empty = 0
+    X = 1
+    O = 2
+    full = 3
+
+    def __str__(self) -> str:
+        return " XO#"[self]
+
+
+# Module-level aliases of the members, reading an enum member through the class
+# is several times slower than a global lookup
+_EMPTY = GameSymbol.empty
+_X = GameSymbol.X
+_O = GameSymbol.O
+_FULL = GameSymbol.full
@@ -0,0 +1,180 @@
+import numpy as np
+from numba import cuda, njit
+
+from core._kernels import EMPTY, FULL, O, X
+
+# Cell indices (row * 3 + col) of the winning lines of a 3x3 board
+_LINES = np.array(
+    [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8],
+        [0, 3, 6],
+        [1, 4, 7],
+        [2, 5, 8],
+        [0, 4, 8],
+        [2, 4, 6],
+    ],
+    dtype=np.int64,
+)
+
+# Threads per block of the GPU launch
+_THREADS = 128
+
+
+def _evaluate(grids, active, out_winners, out_moves, b, sub):
+    """
+    Evaluates the b-th ultimate tic-tac-toe state of a (B, 9, 9) batch.
+
+    Writes the winner code of the whole board to out_winners[b] and marks the legal cells
+    of the next move in out_moves[b]. active[b] is the index (row * 3 + col) of the sub-board
+    the next move is sent to, or -1 if any undecided sub-board may be played.
+    `sub` is a scratch array of 9 int8 receiving the symbols of the sub-boards.
+    If out_moves is empty (shape (0, 9, 9)), only the winner is computed and `active` is not read.
+
+    Compiled both as a CUDA device function and as a CPU function, so it only uses
+    plain loops and scalar arithmetic.
+    """
+    for s in range(9):
+        r0 = (s // 3) * 3
+        c0 = (s % 3) * 3
+        winner = EMPTY
+        for line in range(8):
+            first = grids[b, r0 + _LINES[line, 0] // 3, c0 + _LINES[line, 0] % 3]
+            if first != X and first != O:
+                continue
+            if (
+                grids[b, r0 + _LINES[line, 1] // 3, c0 + _LINES[line, 1] % 3] == first
+                and grids[b, r0 + _LINES[line, 2] // 3, c0 + _LINES[line, 2] % 3] == first
+            ):
+                winner = first
+                break
+        if winner == EMPTY:
+            winner = FULL
+            for k in range(9):
+                if grids[b, r0 + k // 3, c0 + k % 3] == EMPTY:
+                    winner = EMPTY
+                    break
+        sub[s] = winner
+
+    winner = EMPTY
+    for line in range(8):
+        first = sub[_LINES[line, 0]]
+        if first != X and first != O:
+            continue
+        if sub[_LINES[line, 1]] == first and sub[_LINES[line, 2]] == first:
+            winner = first
+            break
+    if winner == EMPTY:
+        winner = FULL
+        for s in range(9):
+            if sub[s] == EMPTY:
+                winner = EMPTY
+                break
+    out_winners[b] = winner
+    if out_moves.shape[0] == 0:
+        return
+
+    target = active[b]
+    if target >= 0 and sub[target] != EMPTY:
+        target = -1
+    for r in range(9):
+        for c in range(9):
+            s = (r // 3) * 3 + c // 3
+            out_moves[b, r, c] = (
+                winner == EMPTY
+                and grids[b, r, c] == EMPTY
+                and sub[s] == EMPTY
+                and (target < 0 or target == s)
+            )
+
+
+_evaluate_device = cuda.jit(device=True)(_evaluate)
+_evaluate_host = njit(cache=True)(_evaluate)
+
+
+@cuda.jit
+def check_winner_batch(grids, active, out_winners, out_moves):
+    """GPU kernel evaluating one state of the batch per thread"""
+    b = cuda.grid(1)
+    if b < grids.shape[0]:
+        sub = cuda.local.array(9, dtype=np.int8)
+        _evaluate_device(grids, active, out_winners, out_moves, b, sub)
+
+
+@njit(cache=True)
+def _check_winner_batch_host(grids, active, out_winners, out_moves):
+    """CPU counterpart of `check_winner_batch`, used when no CUDA device is available"""
+    sub = np.empty(9, dtype=np.int8)
+    for b in range(grids.shape[0]):
+        _evaluate_host(grids, active, out_winners, out_moves, b, sub)
+
+
+def _run_batch(grids, active, winners, moves) -> None:
+    """Launches the evaluation on the GPU if a CUDA device is available, on the CPU otherwise"""
+    if cuda.is_available():
+        d_winners = cuda.device_array_like(winners)
+        d_moves = cuda.device_array_like(moves)
+        blocks = (grids.shape[0] + _THREADS - 1) // _THREADS
+        check_winner_batch[blocks, _THREADS](
+            cuda.to_device(grids), cuda.to_device(active), d_winners, d_moves
+        )
+        d_winners.copy_to_host(winners)
+        if moves.shape[0]:
+            d_moves.copy_to_host(moves)
+    else:
+        _check_winner_batch_host(grids, active, winners, moves)
+
+
+def _as_grids(grids) -> np.ndarray:
+    """Returns the grids as a contiguous int8 array, checking their shape"""
+    grids = np.ascontiguousarray(grids, dtype=np.int8)
+    if grids.ndim != 3 or grids.shape[1:] != (9, 9):
+        raise ValueError(f"grids must be of shape (B, 9, 9), got {grids.shape}")
+    return grids
+
+
+def evaluate_batch(grids, active=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates a batch of ultimate tic-tac-toe states, on the GPU if a CUDA device is available.
+
+    Args:
+        grids (np.ndarray): (B, 9, 9) symbol codes of the lowest layer cells, as returned by
+            `Board.dense_grid` of a two-layer 3x3 board.
+        active (np.ndarray, optional): (B,) index (row * 3 + col) of the sub-board each next move
+            is sent to, -1 for a free choice. Defaults to -1 for all states.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (B,) int8 winner codes and (B, 9, 9) bool masks of legal cells.
+    Raises:
+        ValueError: If the grids are not of shape (B, 9, 9).
+    """
+    grids = _as_grids(grids)
+    count = grids.shape[0]
+    if active is None:
+        active = np.full(count, -1, dtype=np.int64)
+    else:
+        active = np.ascontiguousarray(active, dtype=np.int64)
+    winners = np.empty(count, dtype=np.int8)
+    moves = np.empty(grids.shape, dtype=np.bool_)
+    if count:
+        _run_batch(grids, active, winners, moves)
+    return winners, moves
+
+
+def winners_batch(grids) -> np.ndarray:
+    """
+    Returns the (B,) int8 winner codes of a batch of ultimate tic-tac-toe states, like
+    `evaluate_batch` but without computing or transferring the legal move masks.
+    Raises:
+        ValueError: If the grids are not of shape (B, 9, 9).
+    """
+    grids = _as_grids(grids)
+    winners = np.empty(grids.shape[0], dtype=np.int8)
+    if grids.shape[0]:
+        _run_batch(
+            grids,
+            np.empty(0, dtype=np.int64),
+            winners,
+            np.empty((0, 9, 9), dtype=np.bool_),
+        )
+    return winners
@@ -0,0 +1,236 @@
+from functools import lru_cache
+
+import numpy as np
+
+from core import tables
+from core.cell import Cell
+from core.game_symbol import _EMPTY, _FULL, _O, _X, GameSymbol
+from core.move import Move
+from core.placeable import Placeable
+
+
+class LeafBoard(Placeable):
+    """
+    Board of the lowest layer of a multi-layered board. Its cells are not Cell objects but bits
+    of two integer bitboards, Cell instances are only synthesized on demand.
+    Attributes:
+        dimensions (tuple): Board size as (rows, columns).
+        rows (int): Number of rows in the board.
+        cols (int): Number of columns in the board.
+        symbol (GameSymbol): Current symbol representing the board's state (empty, full, or winner).
+        win_streak (int): Number of consecutive symbols required to win on this board.
+        x_bb (int): Bitboard of cells holding X, bit index is row * cols + col.
+        o_bb (int): Bitboard of cells holding O, bit index is row * cols + col.
+    """
+
+    __slots__ = (
+        "dimensions",
+        "rows",
+        "cols",
+        "symbol",
+        "win_streak",
+        "x_bb",
+        "o_bb",
+        "_lines",
+        "_lines_at",
+        "_positions",
+    )
+
+    def __init__(self, dimensions: tuple, win_streak: int = 3):
+        self.position = None
+        self.dimensions = dimensions
+        self.rows = dimensions[0]
+        self.cols = dimensions[1]
+        self.symbol = _EMPTY
+        self.win_streak = win_streak
+        self.x_bb = 0
+        self.o_bb = 0
+        (self._lines, self._lines_at, self._positions) = self._tables(
+            self.rows, self.cols, win_streak
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _tables(rows: int, cols: int, streak: int) -> tuple:
+        """
+        Returns the winning line masks of a board of the given shape, the masks passing through
+        each bit index and the position of each bit index. Results are cached per shape.
+        """
+        lines = tables.line_masks(rows, cols, streak)
+        lines_at = tuple(
+            tuple(mask for mask in lines if mask >> index & 1)
+            for index in range(rows * cols)
+        )
+        positions = tuple(divmod(index, cols) for index in range(rows * cols))
+        return lines, lines_at, positions
+
+    def __str__(self):
+        return str(self.dimensions) + str(self.cells)
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __eq__(self, value):
+        return (
+            isinstance(value, LeafBoard)
+            and self.dimensions == value.dimensions
+            and self.x_bb == value.x_bb
+            and self.o_bb == value.o_bb
+        )
+
+    @property
+    def cells(self) -> list[list[Cell]]:
+        """Cell views of the board's cells. Modifying them does not change the board."""
+        return [[self._cell(i, j) for j in range(self.cols)] for i in range(self.rows)]
+
+    def _cell(self, x: int, y: int) -> Cell:
+        """Synthesizes a Cell holding the symbol at (x, y)"""
+        cell = Cell()
+        cell.position = (x, y)
+        cell.symbol = self._symbol_at(x * self.cols + y)
+        return cell
+
+    def _symbol_at(self, index: int) -> GameSymbol:
+        """Returns the symbol stored at the given bit index"""
+        if self.x_bb >> index & 1:
+            return _X
+        if self.o_bb >> index & 1:
+            return _O
+        return _EMPTY
+
+    def dense_grid(self) -> np.ndarray:
+        """Returns the symbols of the cells as an int8 grid of GameSymbol values"""
+        grid = np.zeros(self.rows * self.cols, dtype=np.int8)
+        for index in range(self.rows * self.cols):
+            grid[index] = self._symbol_at(index)
+        return grid.reshape(self.dimensions)
+
+    def make_move(self, move: Move) -> bool:
+        """
+        Places the move's symbol at the move's position.
+        Returns:
+            bool: True if the move was successfully made.
+        Raises:
+            Exception: If the move is invalid (out of bounds, cell already occupied or no player symbol).
+        """
+        (x, y) = move.position
+        if 0 <= x < self.rows and 0 <= y < self.cols:
+            index = x * self.cols + y
+            bit = 1 << index
+            if not (self.x_bb | self.o_bb) & bit:
+                if move.symbol is _X:
+                    self.x_bb |= bit
+                    bitboard = self.x_bb
+                elif move.symbol is _O:
+                    self.o_bb |= bit
+                    bitboard = self.o_bb
+                else:
+                    raise Exception(f"Invalid move {move} played")
+                if self.symbol is _EMPTY:
+                    self.symbol = self._symbol_after(index, bitboard, move.symbol)
+                return True
+
+        raise Exception(f"Invalid move {move} played")
+
+    def undo_move(self, move: Move) -> bool:
+        """
+        Removes the move's symbol from the move's position if it is there.
+        """
+        (x, y) = move.position
+        bit = 1 << (x * self.cols + y)
+        if move.symbol is _X and self.x_bb & bit:
+            self.x_bb &= ~bit
+        elif move.symbol is _O and self.o_bb & bit:
+            self.o_bb &= ~bit
+        else:
+            return False
+        # Keep the first winner while it still owns a line, a rescan could pick the opponent
+        symbol = self.symbol
+        if not (
+            symbol is _X and self._owns_line(self.x_bb)
+            or symbol is _O and self._owns_line(self.o_bb)
+        ):
+            self.symbol = self._evaluate()
+        return True
+
+    def _symbol_after(self, index: int, bitboard: int, symbol: GameSymbol) -> GameSymbol:
+        """Returns the board's symbol after `symbol` was placed at `index` of an undecided board"""
+        for mask in self._lines_at[index]:
+            if bitboard & mask == mask:
+                return symbol
+        if self.empty_cells == 0:
+            return _FULL
+        return _EMPTY
+
+    def _evaluate(self) -> GameSymbol:
+        """Scans all winning lines and returns the board's symbol"""
+        for mask in self._lines:
+            if self.x_bb & mask == mask:
+                return _X
+            if self.o_bb & mask == mask:
+                return _O
+        if self.empty_cells == 0:
+            return _FULL
+        return _EMPTY
+
+    def _owns_line(self, bitboard: int) -> bool:
+        """Checks whether the bitboard holds all cells of one of the winning lines"""
+        for mask in self._lines:
+            if bitboard & mask == mask:
+                return True
+        return False
+
+    @property
+    def winner(self) -> GameSymbol:
+        """Return winner of the board. If it returns GameSymbol.empty, no winner found"""
+        return self.symbol
+
+    @property
+    def empty_cells(self) -> int:
+        """Return number of empty cells in the board"""
+        return self.rows * self.cols - (self.x_bb | self.o_bb).bit_count()
+
+    def sub_board(self, positions) -> Placeable:
+        """
+        Returns a Cell view of the cell at positions[0], or the board itself if positions is empty.
+        """
+        if positions:
+            return self._cell(*positions[0])
+        return self
+
+    def get_valid_moves(
+        self, active=None, first=True, desired_symbol=GameSymbol.empty
+    ) -> list[Move]:
+        """
+        Returns a list of valid moves into the empty cells of the board.
+        Args:
+            active (Optional[list[tuple[int, int]]]): If given, only the cell at active[0] is considered.
+            first (bool): If False, the moves are prefixed with the board's position.
+            desired_symbol (GameSymbol): The symbol assigned to the moves (used only if first=True).
+        Returns:
+            list[Move]: A list of valid Move objects.
+        """
+        if first:
+            prefix, symbol = [], desired_symbol
+        else:
+            prefix, symbol = [self.position], _EMPTY
+        moves: list[Move] = []
+        self._collect_moves(active, prefix, moves, symbol)
+        return moves
+
+    def _collect_moves(self, active, prefix, out, symbol) -> None:
+        """
+        Appends a Move into every empty cell (or only into active[0] if given) to `out`.
+        """
+        if self.symbol is not _EMPTY:
+            return
+        free = ~(self.x_bb | self.o_bb)
+        if active:
+            (x, y) = active[0]
+            if free >> (x * self.cols + y) & 1:
+                out.append(Move([*prefix, (x, y)], symbol))
+            return
+        positions = self._positions
+        for index in range(self.rows * self.cols):
+            if free >> index & 1:
+                out.append(Move([*prefix, positions[index]], symbol))
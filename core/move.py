@@ -8,7 +8,6 @@ class Move:
         positions (list[tuple]): A list of positions representing the move's path through the board hierarchy.
         position (tuple): The first position in the positions list, if available.
         symbol (GameSymbol): The symbol (e.g., X or O) associated with the move.
-        isDecisive (bool): Indicates if the move is decisive (class-level attribute).
     Methods:
         __init__(positions, symbol):
             Initializes a Move with a list of positions and a symbol.
@@ -16,8 +15,6 @@ class Move:
             Checks equality with another Move based on positions and symbol.
         __str__():
             Returns a string representation of the move.
-        str_pos(pos):
-            Converts a list of positions to their string representations.
         sub_board():
             Returns the current move (placeholder for sub-board logic).
         sub_move():
@@ -26,35 +23,24 @@ class Move:
             Returns a new Move with superMove prepended to the positions list.
     """
 
-    isDecisive: bool
+    __slots__ = ("positions", "symbol")
 
     def __init__(self, positions: list[tuple], symbol: GameSymbol) -> None:
         self.positions = positions
-        if positions is not None:
-            self.position = positions[0]
         self.symbol = symbol
 
+    @property
+    def position(self) -> tuple:
+        """The first position in the positions list, or None if there are no positions"""
+        return self.positions[0] if self.positions else None
+
     def __eq__(self, value: object) -> bool:
         if value is None:
             return False
         return (value.positions == self.positions) and (value.symbol == self.symbol)
 
     def __str__(self) -> str:
-        return f"{self.symbol}:{'>'.join(self.str_pos(self.positions))}"
-
-    def str_pos(self, pos: list[tuple]) -> list[str]:
-        """
-        Converts each element in the given position iterable to its string representation.
-        Args:
-            pos (iterable): An iterable containing elements to be converted to strings.
-        Returns:
-            list: A list of string representations of the elements in `pos`.
-        """
-
-        result = []
-        for i in range(len(pos)):
-            result.append(str(pos[i]))
-        return result
+        return f"{self.symbol}:" + ">".join(map(str, self.positions))
 
     def sub_move(self):
         """
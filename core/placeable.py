@@ -3,7 +3,7 @@ class Placeable:
     Each placeabe inherits from this class. It carries just it's position
     """
 
-    position = None
+    __slots__ = ("position",)
 
     def make_move(self, move):
         pass
@@ -14,5 +14,8 @@ class Placeable:
     def sub_board(self, position):
         return self
 
-    def get_valid_moves(self, active=[]):
+    def get_valid_moves(self, active=None):
+        pass
+
+    def _collect_moves(self, active, prefix, out, symbol):
         pass
@@ -0,0 +1,46 @@
+import numpy as np
+
+# Line directions as (dx, dy). Horizontal first: it walks a contiguous row of the row-major grid
+_RAY_DIRS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def line_masks(rows: int, cols: int, streak: int) -> tuple[int, ...]:
+    """
+    Returns bit masks of all horizontal, vertical and diagonal runs of length `streak`
+    on a board of the given shape. Bit index of a cell is row * cols + col.
+    """
+    masks = []
+    for x0 in range(rows):
+        for y0 in range(cols):
+            for dx, dy in _RAY_DIRS:
+                x_end = x0 + (streak - 1) * dx
+                y_end = y0 + (streak - 1) * dy
+                if not (0 <= x_end < rows and 0 <= y_end < cols):
+                    continue
+                mask = 0
+                for k in range(streak):
+                    mask |= 1 << ((x0 + k * dx) * cols + y0 + k * dy)
+                masks.append(mask)
+    return tuple(masks)
+
+
+def build_rays(rows: int, cols: int, streak: int) -> np.ndarray:
+    """
+    Precomputes the rays through every position of a board of the given shape.
+
+    Returns:
+        np.ndarray: An int64 array of shape (rows, cols, 4, 2 * streak). Entry [x, y, d]
+            holds the row-major flat indices of the cells on the ray along _RAY_DIRS[d] through
+            (x, y) that lie inside the board, padded with -1.
+    """
+    rays = np.full((rows, cols, 4, 2 * streak), -1, dtype=np.int64)
+    for x0 in range(rows):
+        for y0 in range(cols):
+            for d, (dx, dy) in enumerate(_RAY_DIRS):
+                ray = [
+                    (x0 + i * dx) * cols + y0 + i * dy
+                    for i in range(-streak, streak)
+                    if 0 <= x0 + i * dx < rows and 0 <= y0 + i * dy < cols
+                ]
+                rays[x0, y0, d, : len(ray)] = ray
+    return rays
@@ -0,0 +1,10 @@
+from core.move import Move
+
+
+def make_layer(dimensions, win_streak):
+    return {"dimensions": tuple(dimensions), "streak": int(win_streak)}
+
+def play(board, symbol, *positions):
+    move = Move(list(positions), symbol)
+    board.make_move(move)
+    return move
@@ -3,6 +3,10 @@ import pytest
 from core.placeable import Placeable
 from core.board import Board
 from core.game_symbol import GameSymbol
+from core.cell import Cell
+from core.move import Move
+from core.leaf_board import LeafBoard
+from tests.core.conftest import make_layer, play
 
 
 class MockCell(Placeable):
@@ -11,9 +15,6 @@ class MockCell(Placeable):
     def __init__(self, **kwargs):
         pass
 
-def make_layer(dimensions, win_streak):
-    return {"dimensions":tuple(dimensions), "streak":int(win_streak)}
-    
 
 def test_board_init_basic():
     board = Board(dimensions=(4, 5), cell_type=MockCell, cell_params={}, win_streak=3)
@@ -86,5 +87,165 @@ def test_board_layers_init():
                     assert board.cells[i][j].cells[k][l].position == (k, l)
 
 
+def test_board_winner_row():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    play(board, GameSymbol.X, (1, 0))
+    play(board, GameSymbol.O, (0, 0))
+    play(board, GameSymbol.X, (1, 1))
+    play(board, GameSymbol.O, (0, 1))
+    assert board.winner == GameSymbol.empty
+    play(board, GameSymbol.X, (1, 2))
+
+    assert board.winner == GameSymbol.X
+    assert board.symbol == GameSymbol.X
+
+def test_board_winner_diagonal_larger_board():
+    board = Board(dimensions=(4, 5), cell_type=Cell, win_streak=3)
+    for k in range(3):
+        play(board, GameSymbol.O, (1 + k, 3 - k))
+
+    assert board.winner == GameSymbol.O
+
+def test_board_winner_full():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    symbols = ["XOX", "XOO", "OXX"]
+    for i, row in enumerate(symbols):
+        for j, s in enumerate(row):
+            play(board, GameSymbol.X if s == "X" else GameSymbol.O, (i, j))
+
+    assert board.winner == GameSymbol.full
+    assert board.final_symbol() == GameSymbol.full
+
+def test_board_undo_move():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    moves = [play(board, GameSymbol.X, (0, j)) for j in range(3)]
+    assert board.symbol == GameSymbol.X
+
+    board.undo_move(moves[-1])
+    assert board.symbol == GameSymbol.empty
+    assert board.winner == GameSymbol.empty
+    assert board.final_symbol() is None
+
+def test_board_nested_winner():
+    board = Board.layers_init([make_layer((3, 3), 3), make_layer((3, 3), 3)])
+    for i in range(3):
+        for j in range(3):
+            play(board, GameSymbol.X, (i, i), (j, j))
+
+    assert board.cells[1][1].symbol == GameSymbol.X
+    assert board.winner == GameSymbol.X
+
+def test_board_winner_after_opponent_run():
+    board = Board(dimensions=(1, 5), cell_type=Cell, win_streak=3)
+    play(board, GameSymbol.X, (0, 0))
+    for j in range(1, 4):
+        play(board, GameSymbol.O, (0, j))
+
+    assert board.winner == GameSymbol.O
+    assert board.empty_cells == 1
+
+def test_board_undo_keeps_previous_winner():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    for j in range(3):
+        play(board, GameSymbol.X, (0, j))
+    move = play(board, GameSymbol.O, (2, 2))
+
+    board.undo_move(move)
+    assert board.winner == GameSymbol.X
+    assert board.empty_cells == 6
+
+def test_board_undo_keeps_first_winner_owning_a_line():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    for j in range(3):
+        play(board, GameSymbol.X, (2, j))
+    for j in range(3):
+        play(board, GameSymbol.O, (0, j))
+    move = play(board, GameSymbol.X, (1, 1))
+    assert board.winner == GameSymbol.X
+
+    board.undo_move(move)
+    assert board.winner == GameSymbol.X
+    assert board.symbol == GameSymbol.X
+
+def test_board_get_valid_moves():
+    board = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    play(board, GameSymbol.X, (1, 1))
+    moves = board.get_valid_moves(desired_symbol=GameSymbol.O)
+
+    assert len(moves) == 8
+    assert all(move.symbol is GameSymbol.O for move in moves)
+    assert Move([(1, 1)], GameSymbol.O) not in moves
+
+def test_board_get_valid_moves_nested_active():
+    board = Board.layers_init([make_layer((3, 3), 3), make_layer((3, 3), 3)])
+    assert len(board.get_valid_moves()) == 81
+
+    play(board, GameSymbol.X, (0, 0), (2, 1))
+    moves = board.get_valid_moves(desired_symbol=GameSymbol.O)
+    assert len(moves) == 9
+    assert all(move.positions[0] == (2, 1) for move in moves)
+    assert Move([(2, 1), (0, 0)], GameSymbol.O) in moves
+
+def test_board_get_valid_moves_nested_decided_sub_board():
+    board = Board.layers_init([make_layer((3, 3), 3), make_layer((3, 3), 3)])
+    for j in range(3):
+        play(board, GameSymbol.X, (1, 1), (0, j))
+    play(board, GameSymbol.O, (0, 0), (1, 1))
+    moves = board.get_valid_moves(desired_symbol=GameSymbol.X)
+
+    assert len(moves) == 81 - 9 - 1
+    assert all(move.positions[0] != (1, 1) for move in moves)
+
+def test_board_zobrist_hash():
+    first = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    second = Board(dimensions=(3, 3), cell_type=Cell, win_streak=3)
+    play(first, GameSymbol.X, (0, 0))
+    play(first, GameSymbol.O, (2, 1))
+    play(second, GameSymbol.O, (2, 1))
+    move = play(second, GameSymbol.X, (0, 0))
+    assert first._zobrist == second._zobrist != 0
+
+    second.undo_move(move)
+    play(second, GameSymbol.O, (0, 0))
+    assert first._zobrist != second._zobrist
+
+def test_board_sub_board():
+    board = Board.layers_init([make_layer((3, 3), 3)] * 3)
+    play(board, GameSymbol.X, (0, 1), (2, 2), (1, 0))
+
+    assert board.sub_board([]) is board
+    assert board.sub_board([(0, 1)]) is board.cells[0][1]
+    assert board.sub_board([(0, 1), (2, 2), (1, 0)]).symbol == GameSymbol.X
+
+@pytest.mark.parametrize("layers", [[make_layer((3, 4), 3)], [make_layer((3, 3), 3), make_layer((4, 5), 4)]])
+def test_board_layers_init_specialized_matches_init(layers):
+    board = Board.layers_init(layers)
+    if len(layers) == 1:
+        expected = Board(dimensions=(3, 4), cell_type=Cell, win_streak=3)
+    else:
+        leaf_params = {"dimensions": (3, 3), "win_streak": 3}
+        expected = Board(dimensions=(4, 5), cell_type=LeafBoard, cell_params=leaf_params, win_streak=4)
+
+    for slot in Board.__slots__:
+        if slot in ("_grid", "_rays"):
+            assert (getattr(board, slot) == getattr(expected, slot)).all(), slot
+        else:
+            assert getattr(board, slot) == getattr(expected, slot), slot
+    assert [cell.position for cell in board._flat] == [cell.position for cell in expected._flat]
+
+def test_board_layers_init_subclass():
+    class TracedBoard(Board):
+        __slots__ = ("traced",)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.traced = True
+
+    board = TracedBoard.layers_init([make_layer((3, 3), 3)] * 2)
+    assert type(board) is TracedBoard
+    assert board.traced
+    assert all(isinstance(cell, LeafBoard) for cell in board._flat)
 
-    
\ No newline at end of file
+def test_board_layers_init_rejects_cell_params():
+    with pytest.raises(TypeError, match="Cell takes no parameters"):
+        Board.layers_init([make_layer((3, 3), 3)], cell_params={"dimensions": (3, 3)})
@@ -6,5 +6,11 @@ def test_game_symbol_uniqueness():
     """
     Test that all GameSymbol attributes are unique.
     """
-    symbols = [GameSymbol.__dict__[attr] for attr in GameSymbol.__dict__]
-    assert len(symbols) == len(set(symbols)), "GameSymbol attributes are not unique"
\ No newline at end of file
+    symbols = [symbol.value for symbol in GameSymbol.__members__.values()]
+    assert len(symbols) == len(set(symbols)), "GameSymbol attributes are not unique"
+
+def test_game_symbol_str():
+    """
+    Test that GameSymbol members are displayed as their board characters.
+    """
+    assert [str(symbol) for symbol in GameSymbol] == [" ", "X", "O", "#"]
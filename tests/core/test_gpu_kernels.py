@@ -0,0 +1,62 @@
+import numpy as np
+
+from core import gpu_kernels
+from core.board import Board
+from core.game_symbol import GameSymbol
+from tests.core.conftest import make_layer, play
+
+# Layers of the ultimate tic-tac-toe board the batch kernels evaluate
+LAYERS = [make_layer((3, 3), 3)] * 2
+
+def target_index(board):
+    """Index of the sub-board the last move sends to, even if that sub-board is decided"""
+    if not board.game_moves:
+        return -1
+    (x, y) = board.game_moves[-1].positions[1]
+    return x * 3 + y
+
+def moves_mask(board):
+    mask = np.zeros((9, 9), dtype=np.bool_)
+    for move in board.get_valid_moves():
+        ((x, y), (i, j)) = move.positions
+        mask[3 * x + i, 3 * y + j] = True
+    return mask
+
+def test_evaluate_batch_moves_match_valid_moves():
+    free = Board.layers_init(LAYERS)
+
+    targeted = Board.layers_init(LAYERS)
+    play(targeted, GameSymbol.X, (0, 0), (2, 1))
+
+    decided_target = Board.layers_init(LAYERS)
+    for j in range(3):
+        play(decided_target, GameSymbol.X, (1, 1), (0, j))
+    play(decided_target, GameSymbol.O, (0, 0), (1, 1))
+
+    boards = [free, targeted, decided_target]
+    assert [target_index(board) for board in boards] == [-1, 7, 4]
+    grids = np.stack([board.dense_grid() for board in boards])
+    active = np.array([target_index(board) for board in boards])
+
+    winners, moves = gpu_kernels.evaluate_batch(grids, active)
+    assert list(winners) == [GameSymbol.empty] * 3
+    for board, mask in zip(boards, moves):
+        assert (mask == moves_mask(board)).all()
+    assert moves[1].sum() == 9
+    assert moves[2].sum() == 81 - 9 - 1
+
+def test_board_dense_grid_and_winner_batch():
+    board = Board.layers_init(LAYERS)
+    for i in range(3):
+        for j in range(3):
+            play(board, GameSymbol.O, (i, 2 - i), (j, j))
+    grid = board.dense_grid()
+
+    assert grid.shape == (9, 9)
+    assert grid[3 * 1 + 2, 3 * 1 + 2] == GameSymbol.O
+    assert grid[0, 1] == GameSymbol.empty
+
+    grids = np.stack([Board.layers_init(LAYERS).dense_grid(), grid])
+    winners = Board.winner_batch(grids)
+    assert list(winners) == [GameSymbol.empty, GameSymbol.O]
+    assert (winners == gpu_kernels.evaluate_batch(grids)[0]).all()
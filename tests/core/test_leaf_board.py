@@ -0,0 +1,58 @@
+import pytest
+
+from core.board import Board
+from core.cell import Cell
+from core.game_symbol import GameSymbol
+from core.leaf_board import LeafBoard
+from core.move import Move
+
+
+def test_leaf_board_layers_init():
+    board = Board.layers_init(layers=[{"dimensions": (3, 3), "streak": 3}] * 2)
+
+    assert all(isinstance(cell, LeafBoard) for row in board.cells for cell in row)
+    assert board.cells[2][1].position == (2, 1)
+
+def test_leaf_board_winner_and_undo():
+    leaf = LeafBoard(dimensions=(3, 3), win_streak=3)
+    moves = [Move([(k, 2 - k)], GameSymbol.O) for k in range(3)]
+    for move in moves:
+        assert leaf.make_move(move)
+
+    assert leaf.symbol == GameSymbol.O
+    assert leaf.get_valid_moves() == []
+
+    assert leaf.undo_move(moves[0])
+    assert leaf.symbol == GameSymbol.empty
+    assert len(leaf.get_valid_moves()) == 7
+
+def test_leaf_board_undo_keeps_first_winner_owning_a_line():
+    leaf = LeafBoard(dimensions=(3, 3), win_streak=3)
+    for j in range(3):
+        leaf.make_move(Move([(2, j)], GameSymbol.X))
+    for j in range(3):
+        leaf.make_move(Move([(0, j)], GameSymbol.O))
+    move = Move([(1, 1)], GameSymbol.X)
+    leaf.make_move(move)
+
+    assert leaf.undo_move(move)
+    assert leaf.symbol == GameSymbol.X
+
+def test_leaf_board_invalid_move():
+    leaf = LeafBoard(dimensions=(3, 3), win_streak=3)
+    leaf.make_move(Move([(1, 1)], GameSymbol.X))
+
+    with pytest.raises(Exception, match="Invalid move"):
+        leaf.make_move(Move([(1, 1)], GameSymbol.O))
+    with pytest.raises(Exception, match="Invalid move"):
+        leaf.make_move(Move([(3, 0)], GameSymbol.O))
+
+def test_leaf_board_cell_views():
+    leaf = LeafBoard(dimensions=(2, 3), win_streak=2)
+    leaf.make_move(Move([(1, 2)], GameSymbol.X))
+
+    cell = leaf.sub_board([(1, 2)])
+    assert isinstance(cell, Cell)
+    assert cell.position == (1, 2)
+    assert cell.symbol == GameSymbol.X
+    assert [str(cell) for cell in leaf.cells[1]] == [" ", " ", "X"]